@@ -0,0 +1,206 @@
+"""
+Console entry point (`stalled_news` script and `python -m stalled_news`).
+
+Keep this module import-light: only argparse at the top; each command imports
+its pipeline lazily inside its branch.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Spaces and slashes both become "-" in artifact dir slugs (one translate pass per field).
+_SLUG_TABLE = str.maketrans({" ": "-", "/": "-"})
+
+
+def _add_ping_parser(sub) -> None:
+    sub.add_parser("ping", help="Sanity check: configs + env wiring")
+
+
+def _add_check_url_parser(sub) -> None:
+    c = sub.add_parser("check-url", help="Check if a URL is allowed by whitelist")
+    c.add_argument("--url", required=True)
+
+
+def _add_serp_run_parser(sub) -> None:
+    s = sub.add_parser("serp-run", help="Run SerpAPI search + whitelist filter + store results (+debug files)")
+    s.add_argument("--project_name", required=True)
+    s.add_argument("--city", required=True)
+    s.add_argument("--rera_id", required=False, default=None)
+
+
+def _add_serp_run_wide_parser(sub) -> None:
+    sw = sub.add_parser("serp-run-wide", help="Wider SERP sweep (adds news/general queries) + whitelist filter")
+    sw.add_argument("--project_name", required=True)
+    sw.add_argument("--city", required=True)
+    sw.add_argument("--rera_id", required=False, default=None)
+
+
+def _add_fetch_extract_parser(sub) -> None:
+    f = sub.add_parser("fetch-extract", help="Fetch + extract content for a stored serp_results.json")
+    f.add_argument("--serp_results", required=True, help="Path to serp_results.json from artifacts")
+    f.add_argument("--concurrency", required=False, type=int, default=8, help="URLs fetched in parallel (default 8)")
+    f.add_argument("--extract_workers", required=False, type=int, default=1, help="Worker processes for HTML/PDF text extraction (default 1)")
+
+
+def _add_extract_events_parser(sub) -> None:
+    e = sub.add_parser("extract-events", help="Extract dated events from evidence.json (strict snippet-backed)")
+    e.add_argument("--evidence", required=True, help="Path to evidence.json in artifacts run dir")
+    e.add_argument("--min_conf", required=False, default="0.55", help="Minimum confidence threshold (default 0.55)")
+    e.add_argument("--project_name", required=False, default=None, help="Optional: project name to relevance-filter events (recommended)")
+    e.add_argument("--city", required=False, default=None, help="Optional: city to relevance-filter events")
+    e.add_argument("--rera_id", required=False, default=None, help="Optional: RERA id to relevance-filter events")
+    e.add_argument("--workers", required=False, type=int, default=None, help="Worker processes for per-doc extraction; 0 or less = one per CPU (default: $STALLED_NEWS_WORKERS or 1)")
+
+
+def _add_render_news_parser(sub) -> None:
+    n = sub.add_parser("render-news", help="Generate news.json + news.html using OpenAI (evidence-bounded)")
+    n.add_argument("--project_name", required=True)
+    n.add_argument("--city", required=True)
+    n.add_argument("--rera_id", required=False, default=None)
+    n.add_argument("--run_dir", required=True, help="Artifacts run dir containing events_deduped.json")
+    n.add_argument("--events", required=False, default="events_deduped.json")
+
+
+_SUBPARSERS: Dict[str, Callable[[Any], None]] = {
+    "ping": _add_ping_parser,
+    "check-url": _add_check_url_parser,
+    "serp-run": _add_serp_run_parser,
+    "serp-run-wide": _add_serp_run_wide_parser,
+    "fetch-extract": _add_fetch_extract_parser,
+    "extract-events": _add_extract_events_parser,
+    "render-news": _add_render_news_parser,
+}
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """First positional token of argv (the subcommand), or None for --help/no args."""
+    for t in argv[1:]:
+        if not t.startswith("-"):
+            return t
+    return None
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Builds the CLI parser.
+    If `command` is a known subcommand, only that subparser is registered;
+    otherwise (None, --help, typos) the full tree is built so help/errors list everything.
+    """
+    p = argparse.ArgumentParser(prog="stalled_news")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    if command in _SUBPARSERS:
+        _SUBPARSERS[command](sub)
+        return p
+
+    for add in _SUBPARSERS.values():
+        add(sub)
+    return p
+
+
+def main() -> None:
+    parser = build_parser(_sniff_subcommand(sys.argv))
+    args = parser.parse_args()
+
+    # Pipeline modules pull in YAML, HTTP, OpenAI and dateparser; import them only
+    # inside the branch that needs them so `ping`/`--help` stay cheap.
+    if args.command == "ping":
+        from .commands import cmd_ping
+
+        cmd_ping()
+        return
+
+    if args.command == "check-url":
+        from .commands import cmd_check_url
+
+        cmd_check_url(args.url)
+        return
+
+    if args.command == "serp-run":
+        from .models import ProjectInput
+        from .serp_pipeline import run_serp_search_with_debug, store_serp_run_with_debug
+
+        project = ProjectInput(project_name=args.project_name, city=args.city, rera_id=args.rera_id)
+        run, all_debug, domain_counts, raw_debug = run_serp_search_with_debug(project)
+        out_path = store_serp_run_with_debug(run, all_debug, domain_counts, raw_debug)
+        print(f"stored: {out_path}")
+        print(f"whitelisted_results: {run.results_whitelisted}")
+        return
+
+    if args.command == "serp-run-wide":
+        from datetime import datetime
+
+        from .jsonio import dumps_pretty
+        from .models import ProjectInput
+        from .serp_wide_pipeline import run_serp_wide
+
+        project = ProjectInput(project_name=args.project_name, city=args.city, rera_id=args.rera_id)
+        wide = run_serp_wide(project)
+        # Store in the same serp_results.json shape expected by fetch-extract
+        slug = f"{project.project_name.lower().translate(_SLUG_TABLE)}-{project.city.lower().translate(_SLUG_TABLE)}"
+        if project.rera_id:
+            slug += f"-{project.rera_id.lower().translate(_SLUG_TABLE)}"
+        out_dir = Path('artifacts') / slug
+        run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+        target = out_dir / run_id
+        target.mkdir(parents=True, exist_ok=True)
+
+        (target / "serp_results_all.json").write_bytes(dumps_pretty(wide.all_results))
+        (target / "serp_domains_summary.json").write_bytes(dumps_pretty(wide.domain_counts))
+        (target / "serp_results.json").write_bytes(dumps_pretty(wide.whitelisted))
+
+        print(f"stored: {target / 'serp_results.json'}")
+        print(f"whitelisted_results: {len(wide.whitelisted)}")
+        return
+
+    if args.command == "fetch-extract":
+        from .evidence_pipeline import fetch_and_extract_from_serp
+
+        p = Path(args.serp_results).expanduser().resolve()
+        out = fetch_and_extract_from_serp(p, concurrency=args.concurrency, extract_workers=args.extract_workers)
+        print(f"evidence_stored: {out}")
+        return
+
+    if args.command == "extract-events":
+        from .event_extractor import extract_events_from_evidence, store_events
+
+        evp = Path(args.evidence).expanduser().resolve()
+        min_conf = float(args.min_conf)
+        raw, deduped = extract_events_from_evidence(
+            evp,
+            project_name=args.project_name,
+            city=args.city,
+            rera_id=args.rera_id,
+            min_confidence=min_conf,
+            workers=args.workers,
+        )
+        raw_path, deduped_path, timeline_path = store_events(evp, raw, deduped)
+        print(f"events_raw: {raw_path}")
+        print(f"events_deduped: {deduped_path}")
+        print(f"timeline: {timeline_path}")
+        print(f"raw_count={len(raw)} deduped_count={len(deduped)}")
+        return
+
+    if args.command == "render-news":
+        from .models import ProjectInput
+        from .news_generator import build_news_with_openai
+
+        project = ProjectInput(project_name=args.project_name, city=args.city, rera_id=args.rera_id)
+        run_dir = Path(args.run_dir).expanduser().resolve()
+        events_path = (run_dir / args.events).resolve()
+
+        news_json, news_html, inputs_json, raw_json = build_news_with_openai(
+            project=project,
+            run_dir=run_dir,
+            events_deduped_path=events_path,
+        )
+        print(f"news_json: {news_json}")
+        print(f"news_html: {news_html}")
+        print(f"news_inputs: {inputs_json}")
+        print(f"news_llm_raw: {raw_json}")
+        return
+
+    parser.error(f"Unknown command: {args.command}")
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from itertools import islice
+
 import typer
-from rich import print
 
 from .config import load_config, repo_root
 from . import __version__
@@ -17,7 +18,9 @@ def ping() -> None:
     cfg = load_config()
     root = repo_root()
 
-    print(f"[bold]stalled-project-news[/bold] version={__version__}")
+    from rich import print as rprint  # only the banner uses markup; keep rich off the import path
+
+    rprint(f"[bold]stalled-project-news[/bold] version={__version__}")
     print(f"env={cfg.env}")
     print(f"repo_root={root}")
 
@@ -33,7 +36,7 @@ def ping() -> None:
     print(f"whitelist domains count={len(cfg.whitelist_domains)}")
     if cfg.whitelist_domains:
         print("first few domains:")
-        for d in cfg.whitelist_domains[:12]:
+        for d in islice(cfg.whitelist_domains, 12):
             print(f"  - {d}")
 
     base_dir = cfg.settings.get("artifacts", {}).get("base_dir", "artifacts")
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-from rich import print
+from itertools import islice
 
-from .config import load_config, repo_root, load_yaml
+from .config import load_config, repo_root
 from . import __version__
-from .whitelist import WhitelistPolicy, is_url_allowed
+from .whitelist import is_url_allowed
+from .whitelist_helpers import load_whitelist_policy
 
 
 def cmd_ping() -> None:
     cfg = load_config()
     root = repo_root()
 
-    print(f"[bold]stalled-project-news[/bold] version={__version__}")
+    from rich import print as rprint  # only the banner uses markup; keep rich off the import path
+
+    rprint(f"[bold]stalled-project-news[/bold] version={__version__}")
     print(f"env={cfg.env}")
     print(f"repo_root={root}")
 
@@ -26,7 +29,7 @@ def cmd_ping() -> None:
     print(f"whitelist domains count={len(cfg.whitelist_domains)}")
     if cfg.whitelist_domains:
         print("first few domains:")
-        for d in cfg.whitelist_domains[:12]:
+        for d in islice(cfg.whitelist_domains, 12):
             print(f"  - {d}")
 
     base_dir = cfg.settings.get("artifacts", {}).get("base_dir", "artifacts")
@@ -36,11 +39,7 @@ def cmd_ping() -> None:
 
 
 def cmd_check_url(url: str) -> None:
-    root = repo_root()
-    wl = load_yaml(root / "configs" / "whitelist.yaml")
-    domains = wl.get("domains", [])
-    sub_allowed = wl.get("subdomain_allowed", [])
-    policy = WhitelistPolicy.from_config(domains, sub_allowed)
+    policy = load_whitelist_policy()  # cached per whitelist.yaml mtime
 
     allowed = is_url_allowed(url, policy)
     print(f"url={url}")
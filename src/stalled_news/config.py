@@ -2,22 +2,41 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
-from dotenv import load_dotenv
+
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed, much faster when available
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader
 
 
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing config file: {path}") from None
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    with open(path_str, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
 def load_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"Missing config file: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    """
+    Parse a YAML config file, memoized on (path, mtime) so repeated calls in one
+    process skip re-parsing until the file changes. Callers must not mutate the result.
+    """
+    return _load_yaml_cached(str(path), _mtime_ns(path))
 
 
 @dataclass(frozen=True)
@@ -25,20 +44,35 @@ class AppConfig:
     env: str
     openai_api_key_present: bool
     serpapi_api_key_present: bool
-    whitelist_domains: List[str]
+    whitelist_domains: Tuple[str, ...]
     settings: Dict[str, Any]
 
 
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once() -> None:
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    from dotenv import load_dotenv  # imported lazily: only config-reading commands need it
+
+    # Force load repo-root .env (and override any shell vars for local dev determinism)
+    load_dotenv(repo_root() / ".env", override=True)
+    _DOTENV_LOADED = True
+
+
 def load_config(
     settings_path: Optional[Path] = None,
     whitelist_path: Optional[Path] = None,
 ) -> AppConfig:
-    # Force load repo-root .env (and override any shell vars for local dev determinism)
-    load_dotenv(repo_root() / ".env", override=True)
+    _load_dotenv_once()
 
     settings_path = settings_path or (repo_root() / "configs" / "settings.yaml")
     whitelist_path = whitelist_path or (repo_root() / "configs" / "whitelist.yaml")
 
+    # Only the YAML parses are memoized (load_yaml); the env-derived fields are re-read on
+    # every call so changes to APP_ENV / API keys in the same process are picked up.
     settings = load_yaml(settings_path)
     whitelist = load_yaml(whitelist_path)
 
@@ -55,6 +89,6 @@ def load_config(
         env=str(env),
         openai_api_key_present=bool(openai_key.strip()),
         serpapi_api_key_present=bool(serpapi_key.strip()),
-        whitelist_domains=[d.strip().lower() for d in domains if d.strip()],
+        whitelist_domains=tuple(d.strip().lower() for d in domains if d.strip()),
         settings=settings,
     )
@@ -1,14 +1,19 @@
-import json
+import heapq
+import os
 import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import dateparser
+from .jsonio import dumps_pretty, load_json
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidenceRef:
     doc_id: str
     url: str
@@ -18,7 +23,7 @@ class EvidenceRef:
     text_path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineEvent:
     date: str  # ISO yyyy-mm-dd
     claim: str
@@ -27,22 +32,31 @@ class TimelineEvent:
     evidence: EvidenceRef
 
 
-DATE_PATTERNS = [
+_MONTH_NAMES = (
+    r"Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?"
+    r"|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?"
+)
+
+# All supported date shapes fused into one alternation so each document is scanned once.
+# Each branch is an outer named group; m.lastgroup tells which shape matched.
+# The leading lookahead lists every possible first char (digit or month initial); sre turns
+# it into a fast charset skip instead of trying all four branches at every position.
+DATE_RE = re.compile(
+    r"(?=[\dJFMASOND])(?:"
     # dd.mm.yyyy or dd-mm-yyyy or dd/mm/yyyy
-    re.compile(r"\b([0-3]?\d)[./-]([01]?\d)[./-]((?:19|20)\d{2})\b"),
+    r"(?P<dmy>\b(?P<dmy_d>[0-3]?\d)[./-](?P<dmy_m>[01]?\d)[./-](?P<dmy_y>(?:19|20)\d{2})\b)"
     # yyyy-mm-dd
-    re.compile(r"\b((?:19|20)\d{2})-([01]\d)-([0-3]\d)\b"),
+    r"|(?P<ymd>\b(?P<ymd_y>(?:19|20)\d{2})-(?P<ymd_m>[01]\d)-(?P<ymd_d>[0-3]\d)\b)"
     # Month dd, yyyy
-    re.compile(
-        r"\b(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+([0-3]?\d)(?:st|nd|rd|th)?,\s+((?:19|20)\d{2})\b",
-        re.I,
-    ),
+    r"|(?P<mdy>\b(?P<mdy_m>" + _MONTH_NAMES + r")\s+(?P<mdy_d>[0-3]?\d)(?:st|nd|rd|th)?,\s+(?P<mdy_y>(?:19|20)\d{2})\b)"
     # dd Month yyyy
-    re.compile(
-        r"\b([0-3]?\d)\s+(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+((?:19|20)\d{2})\b",
-        re.I,
-    ),
-]
+    r"|(?P<dmony>\b(?P<dmony_d>[0-3]?\d)\s+(?P<dmony_m>" + _MONTH_NAMES + r")\s+(?P<dmony_y>(?:19|20)\d{2})\b)"
+    r")",
+    re.I,
+)
+# Every DATE_RE shape needs a digit; this C-level probe stops at the first one.
+_HAS_DIGIT = re.compile(r"\d").search
+_DOT_RE = re.compile(r"\.")
 
 KEYWORD_TAGS = {
     "rera": [
@@ -84,6 +98,11 @@ KEYWORD_TAGS = {
     "news": ["reported", "announced", "said", "according to", "sources", "article", "news"],
 }
 
+# Frozen (tag, keywords) pairs for the hot _extract_tags loop (tuple iteration, no dict views).
+_KEYWORD_TAGS_FLAT: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (tag, tuple(kws)) for tag, kws in KEYWORD_TAGS.items()
+)
+
 STOPWORDS = {
     "the",
     "and",
@@ -113,33 +132,66 @@ STOPWORDS = {
 
 
 def _normalize(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip().lower()
+    # split()/join collapses the same whitespace set as r"\s+" and is several times faster than re.sub
+    return " ".join((s or "").split()).lower()
 
 
 def _to_iso(d: date) -> str:
     return d.isoformat()
 
 
-def _parse_date_from_match(m: re.Match) -> Optional[str]:
-    txt = m.group(0)
-    dt = dateparser.parse(
-        txt,
-        settings={
-            "PREFER_DAY_OF_MONTH": "first",
-            "PREFER_DATES_FROM": "past",
-            "DATE_ORDER": "DMY",
-            "STRICT_PARSING": False,
-        },
-    )
+# Built once; dateparser only reads it.
+_DATEPARSER_SETTINGS = {
+    "PREFER_DAY_OF_MONTH": "first",
+    "PREFER_DATES_FROM": "past",
+    "DATE_ORDER": "DMY",
+    "STRICT_PARSING": False,
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(txt: str) -> Optional[str]:
+    # dateparser costs hundreds of µs per call; the same literals recur across windows and docs.
+    # Imported lazily: it takes ~0.4s to load and most runs never leave the regex-group fast path.
+    import dateparser
+
+    dt = dateparser.parse(txt, settings=_DATEPARSER_SETTINGS)
     if not dt:
         return None
     return _to_iso(dt.date())
 
 
-def _extract_tags(snippet: str) -> List[str]:
-    s = _normalize(snippet)
+_MONTH_NUM = {
+    name: i
+    for i, name in enumerate(("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1)
+}
+
+
+def _fast_iso_from_match(m: re.Match) -> Optional[str]:
+    """ISO date straight from DATE_RE's groups (DMY order for numeric dates), or None if not a valid date."""
+    kind = m.lastgroup
+    d, mo, y = m.group(kind + "_d", kind + "_m", kind + "_y")
+    month = _MONTH_NUM[mo[:3].lower()] if mo[0].isalpha() else int(mo)
+    try:
+        return date(int(y), month, int(d)).isoformat()
+    except ValueError:
+        return None
+
+
+def _parse_date_from_match(m: re.Match) -> Optional[str]:
+    # The regex already captured d/m/y; dateparser is only the fallback for odd values
+    # (e.g. month 13, day 0) where its own heuristics decide. ISO yyyy-mm-dd never goes
+    # to dateparser: with DATE_ORDER=DMY it reads it as y-d-m (swapping or dropping dates).
+    iso = _fast_iso_from_match(m)
+    if iso or m.lastgroup == "ymd":
+        return iso
+    return _parse_date_text(m.group(0))
+
+
+def _extract_tags(s: str) -> List[str]:
+    """`s` must already be _normalize()d (see _find_events_in_text)."""
     tags: List[str] = []
-    for tag, kws in KEYWORD_TAGS.items():
+    for tag, kws in _KEYWORD_TAGS_FLAT:
         for kw in kws:
             if kw in s:
                 tags.append(tag)
@@ -147,23 +199,49 @@ def _extract_tags(snippet: str) -> List[str]:
     return tags or ["general"]
 
 
-def _confidence(snippet: str) -> float:
-    s = _normalize(snippet)
-    score = 0.35
-    if any(k in s for k in ["order", "hearing", "directed", "authority", "rera", "penalty", "revocation", "suspended"]):
-        score += 0.25
-    if any(k in s for k in ["dated", "date", "on ", "as on", "adjourned", "come up"]):
-        score += 0.10
+_CONF_BASE = 0.35
+_CONF_STRONG = 0.25
+_CONF_DATED = 0.10
+_CONF_LONG = 0.10
+_CONF_HEDGE = 0.10
+_STRONG_KWS = ("order", "hearing", "directed", "authority", "rera", "penalty", "revocation", "suspended")
+_DATED_KWS = ("dated", "date", "on ", "as on", "adjourned", "come up")
+_HEDGE_KWS = ("alleged", "rumour", "rumor")
+# Highest score reachable without a strong keyword (same float arithmetic as _confidence).
+_WEAK_CONF_CEILING = min(0.99, _CONF_BASE + _CONF_DATED + _CONF_LONG)
+
+
+def _confidence(s: str) -> float:
+    """`s` must already be _normalize()d (see _find_events_in_text)."""
+    # Plain for/break loops: same short-circuit as any(), without a generator frame per bucket.
+    score = _CONF_BASE
+    for k in _STRONG_KWS:
+        if k in s:
+            score += _CONF_STRONG
+            break
+    for k in _DATED_KWS:
+        if k in s:
+            score += _CONF_DATED
+            break
     if len(s) > 120:
-        score += 0.10
-    if any(k in s for k in ["alleged", "rumour", "rumor"]):
-        score -= 0.10
+        score += _CONF_LONG
+    for k in _HEDGE_KWS:
+        if k in s:
+            score -= _CONF_HEDGE
+            break
     return max(0.0, min(0.99, score))
 
 
+_CLAIM_MAX_CHARS = 420
+_ELLIPSIS = "\u2026"  # single-codepoint "…"
+
+
 def _claim_from_snippet(snippet: str) -> str:
-    s = re.sub(r"\s+", " ", snippet).strip()
-    return s[:420] + ("…" if len(s) > 420 else "")
+    # Snippets are sliced from whitespace-normalized text, so there are no runs to collapse.
+    s = snippet.strip()
+    if len(s) <= _CLAIM_MAX_CHARS:
+        return s
+    return s[:_CLAIM_MAX_CHARS] + _ELLIPSIS
 
 
 RERA_REGEX = re.compile(r"\b([A-Z]{2,6})\s*[/\-]\s*(\d{1,6})\s*[/\-]\s*(\d{1,6})\s*[/\-]\s*((?:19|20)\d{2})\s*[/\-]\s*(\d{1,6})\b")
@@ -176,29 +254,28 @@ def _extract_rera_ids(text: str) -> List[str]:
     return out
 
 
-def _tokenize_project(project_name: Optional[str]) -> List[str]:
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=256)
+def _tokenize_project(project_name: Optional[str]) -> Tuple[str, ...]:
+    # Cached per name (tuple, so the shared result can't be mutated by callers).
     if not project_name:
-        return []
-    toks = [t for t in re.split(r"[^a-z0-9]+", _normalize(project_name)) if t]
+        return ()
+    toks = [t for t in _TOKEN_SPLIT_RE.split(_normalize(project_name)) if t]
     toks = [t for t in toks if len(t) >= 3 and t not in STOPWORDS]
     # de-dupe while preserving order
-    seen = set()
-    out = []
-    for t in toks:
-        if t in seen:
-            continue
-        seen.add(t)
-        out.append(t)
-    return out
+    return tuple(dict.fromkeys(toks))
 
 
-def _count_token_hits(hay: str, tokens: List[str]) -> int:
-    if not hay or not tokens:
+def _count_token_hits(h: str, tokens: Tuple[str, ...]) -> int:
+    """`h` must already be _normalize()d; callers normalize once and reuse it for the city check."""
+    if not h or not tokens:
         return 0
-    h = _normalize(hay)
     return sum(1 for t in tokens if t in h)
 
 
+@lru_cache(maxsize=256)
 def _rera_pattern(rera_id: Optional[str]) -> Optional[re.Pattern]:
     if not rera_id:
         return None
@@ -209,20 +286,24 @@ def _rera_pattern(rera_id: Optional[str]) -> Optional[re.Pattern]:
     return re.compile(esc)
 
 
+_DOC_GATE_CHARS = 4000
+
+
 def _is_doc_relevant(
     *,
     text: str,
     snippet: str,
     url: str,
-    project_tokens: List[str],
+    project_tokens: Tuple[str, ...],
     city: Optional[str],
     rera_pat: Optional[re.Pattern],
 ) -> bool:
-    hay = " ".join([snippet or "", url or "", text[:4000] if text else ""])
+    hay = " ".join([snippet or "", url or "", text[:_DOC_GATE_CHARS] if text else ""])
     if rera_pat and rera_pat.search(hay.upper()):
         return True
 
-    hits = _count_token_hits(hay, project_tokens)
+    h = _normalize(hay)
+    hits = _count_token_hits(h, project_tokens)
     if project_tokens:
         # Require at least 2 token hits for multi-token names
         need = 2 if len(project_tokens) >= 2 else 1
@@ -231,7 +312,7 @@ def _is_doc_relevant(
 
     # Fallback: city + at least one token
     if city and project_tokens:
-        if _normalize(city) in _normalize(hay) and hits >= 1:
+        if hits >= 1 and _normalize(city) in h:
             return True
 
     return False
@@ -240,7 +321,7 @@ def _is_doc_relevant(
 def _is_event_relevant(
     *,
     snippet: str,
-    project_tokens: List[str],
+    project_tokens: Tuple[str, ...],
     city: Optional[str],
     rera_pat: Optional[re.Pattern],
 ) -> bool:
@@ -251,25 +332,29 @@ def _is_event_relevant(
     if rera_pat and rera_pat.search(s.upper()):
         return True
 
-    hits = _count_token_hits(s, project_tokens)
+    h = _normalize(s)
+    hits = _count_token_hits(h, project_tokens)
     if project_tokens:
         need = 2 if len(project_tokens) >= 2 else 1
         if hits >= need:
             return True
 
     if city and project_tokens:
-        if _normalize(city) in _normalize(s) and hits >= 1:
+        if hits >= 1 and _normalize(city) in h:
             return True
 
     return False
 
 
-def _date_in_range(iso: str, *, min_year: int = 2000, future_years: int = 3) -> bool:
+def _date_in_range(iso: str, *, min_year: int = 2000, future_years: int = 3, today: Optional[date] = None) -> bool:
+    # `iso` always comes from date.isoformat(), so fromisoformat parses it exactly (and far
+    # cheaper than strptime). Callers scanning many dates pass `today` once.
     try:
-        d = datetime.strptime(iso, "%Y-%m-%d").date()
+        d = date.fromisoformat(iso)
     except Exception:
         return False
-    today = datetime.utcnow().date()
+    if today is None:
+        today = datetime.utcnow().date()
     if d.year < min_year:
         return False
     if d > (today + timedelta(days=365 * future_years)):
@@ -277,51 +362,84 @@ def _date_in_range(iso: str, *, min_year: int = 2000, future_years: int = 3) ->
     return True
 
 
-def _find_events_in_text(text: str) -> List[Tuple[str, str, float, List[str]]]:
-    """Returns list of (iso_date, snippet, confidence, tags)."""
-    norm_text = " ".join(text.split())
+def _find_events_in_text(norm_text: str) -> List[Tuple[str, str, float, List[str]]]:
+    """Returns list of (iso_date, snippet, confidence, tags).
+
+    Expects whitespace-normalized text (" ".join(text.split())); callers normalize once per doc.
+    """
     events: List[Tuple[str, str, float, List[str]]] = []
+    if not _HAS_DIGIT(norm_text):
+        return events
 
-    for pat in DATE_PATTERNS:
-        for m in pat.finditer(norm_text):
-            iso = _parse_date_from_match(m)
-            if not iso:
-                continue
-            if not _date_in_range(iso):
-                continue
+    dots: Optional[List[int]] = None
+    today = datetime.utcnow().date()
 
-            start = max(0, m.start() - 220)
-            end = min(len(norm_text), m.end() + 220)
-            window = norm_text[start:end].strip()
-
-            snippet = window
-            if "." in window:
-                parts = window.split(".")
-                snippet = ".".join(parts[:2]).strip()
-                if len(snippet) < 40 and len(parts) > 2:
-                    snippet = ".".join(parts[:3]).strip()
-            snippet = snippet[:520].strip()
-            if len(snippet) < 30:
-                continue
+    for m in DATE_RE.finditer(norm_text):
+        iso = _parse_date_from_match(m)
+        if not iso:
+            continue
+        if not _date_in_range(iso, today=today):
+            continue
 
-            tags = _extract_tags(snippet)
-            conf = _confidence(snippet)
-            events.append((iso, snippet, conf, tags))
+        start = max(0, m.start() - 220)
+        end = min(len(norm_text), m.end() + 220)
+
+        # Window = text up to the 2nd "." after `start` (3rd if that is too short), else the whole
+        # +/-220 span. Dot offsets are indexed once per doc and bisected, instead of split/join per match.
+        if dots is None:
+            dots = [d.start() for d in _DOT_RE.finditer(norm_text)]
+        k = bisect_left(dots, start)
+        if k + 1 < len(dots) and dots[k + 1] < end:
+            snippet = norm_text[start:dots[k + 1]].strip()
+            if len(snippet) < 40:
+                cut = dots[k + 2] if k + 2 < len(dots) and dots[k + 2] < end else end
+                snippet = norm_text[start:cut].strip()
+        else:
+            snippet = norm_text[start:end].strip()
+        snippet = snippet[:520].strip()
+        if len(snippet) < 30:
+            continue
+
+        # snippet is cut from whitespace-normalized text and stripped, so lower() == _normalize()
+        snippet_norm = snippet.lower()
+        tags = _extract_tags(snippet_norm)
+        conf = _confidence(snippet_norm)
+        events.append((iso, snippet, conf, tags))
 
     return events
 
 
+def _dedupe_key(ev: TimelineEvent) -> Tuple[str, str]:
+    # Claims come from _claim_from_snippet (whitespace already collapsed and stripped),
+    # so lower() is all _normalize() would still do.
+    return ev.date, ev.claim.lower()[:160]
+
+
 def load_text(path_str: str) -> str:
-    p = Path(path_str)
-    if not p.exists():
+    # EAFP: one open() instead of exists() + open(); missing/unreadable -> ""
+    try:
+        return Path(path_str).read_text(encoding="utf-8", errors="replace")
+    except OSError:
         return ""
-    return p.read_text(encoding="utf-8", errors="replace")
 
 
-def _load_project_hints(evidence_path: Path) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-    """Best-effort project hints from evidence.json (wide format) or path."""
+def load_text_head(path_str: str, n_chars: int) -> str:
+    """First n_chars of a text file (same decoding as load_text) without reading the rest."""
     try:
-        data = json.loads(evidence_path.read_text(encoding="utf-8"))
+        with open(path_str, "r", encoding="utf-8", errors="replace") as f:
+            return f.read(n_chars)
+    except OSError:
+        return ""
+
+
+def _load_project_hints(evidence_path: Path, data: Any = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Best-effort project hints from evidence.json (wide format) or path.
+
+    Pass the already-parsed evidence as `data` to avoid reading the file again.
+    """
+    try:
+        if data is None:
+            data = load_json(evidence_path)
         if isinstance(data, dict) and isinstance(data.get("project"), dict):
             pj = data["project"]
             return pj.get("project_name"), pj.get("city"), pj.get("rera_id")
@@ -357,45 +475,56 @@ def _load_project_hints(evidence_path: Path) -> Tuple[Optional[str], Optional[st
         return None, None, None
 
 
+def _rera_head(tp: str) -> str:
+    # Best-effort like the rest of inference: any unreadable path just contributes nothing.
+    try:
+        return load_text_head(tp, 8000)
+    except Exception:
+        return ""
+
+
 def _infer_rera_from_docs(docs: List[Dict[str, Any]]) -> Optional[str]:
     """If evidence.json is missing rera_id, infer the most frequent RERA id pattern across extracted texts/snippets."""
     counts: Dict[str, int] = {}
-    for d in docs[:40]:
+    sample = docs[:40]
+    for d in sample:
         snippet = str(d.get("snippet") or "")
         for rid in _extract_rera_ids(snippet):
             counts[rid] = counts.get(rid, 0) + 2
 
-        tp = str(d.get("textPath") or "")
-        if tp:
-            try:
-                txt = load_text(tp)[:8000]
+    # The head reads are I/O bound (open() + read release the GIL), so overlap them on threads;
+    # the regex scan stays serial.
+    paths = [tp for tp in (str(d.get("textPath") or "") for d in sample) if tp]
+    if paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            for txt in ex.map(_rera_head, paths):
                 for rid in _extract_rera_ids(txt):
                     counts[rid] = counts.get(rid, 0) + 1
-            except Exception:
-                pass
 
     if not counts:
         return None
     return sorted(counts.items(), key=lambda x: (-x[1], x[0]))[0][0]
 
 
-def load_evidence(evidence_path: Path) -> List[Dict[str, Any]]:
-    """Compatibility loader.
+def iter_evidence(evidence_path: Path, data: Any = None) -> Iterator[Dict[str, Any]]:
+    """Compatibility loader, yielding one per-doc dict at a time.
+    Pass the already-parsed evidence as `data` to skip re-reading the file.
 
-    Returns a list of per-doc dicts with keys:
+    Yields dicts with keys:
       id, url, finalUrl, domain, snippet, textPath, textChars, needsOcr
 
     Supports:
-      - old format: list[dict]
+      - old format: list[dict] (items yielded as-is)
       - wide format: {"counts":..., "docs": [...]} (Step 6E)
     """
-    data = json.loads(evidence_path.read_text(encoding="utf-8"))
+    if data is None:
+        data = load_json(evidence_path)
 
     if isinstance(data, list):
-        return data
+        yield from data
+        return
 
     if isinstance(data, dict) and isinstance(data.get("docs"), list):
-        out: List[Dict[str, Any]] = []
         for d in data["docs"]:
             if not isinstance(d, dict):
                 continue
@@ -406,31 +535,135 @@ def load_evidence(evidence_path: Path) -> List[Dict[str, Any]]:
             snippet = (d.get("snippet") or "").strip()
             text_path = (d.get("text_path") or d.get("textPath") or "").strip()
 
+            # Byte size from stat() instead of reading + decoding the whole file;
+            # downstream only uses textChars as a non-empty gate.
             text_chars = 0
-            try:
-                tp = Path(text_path) if text_path else None
-                if tp and tp.exists():
-                    text_chars = len(tp.read_text(encoding="utf-8", errors="replace"))
-            except Exception:
-                text_chars = 0
-
-            out.append(
-                {
-                    "id": doc_id,
-                    "url": url,
-                    "finalUrl": final_url,
-                    "domain": domain,
-                    "snippet": snippet,
-                    "textPath": text_path,
-                    "textChars": text_chars,
-                    "needsOcr": False,
-                }
-            )
-        return out
+            if text_path:
+                try:
+                    text_chars = Path(text_path).stat().st_size
+                except OSError:
+                    text_chars = 0
+
+            yield {
+                "id": doc_id,
+                "url": url,
+                "finalUrl": final_url,
+                "domain": domain,
+                "snippet": snippet,
+                "textPath": text_path,
+                "textChars": text_chars,
+                "needsOcr": False,
+            }
+        return
 
     raise ValueError(f"Unsupported evidence.json format at: {evidence_path}")
 
 
+def load_evidence(evidence_path: Path) -> List[Dict[str, Any]]:
+    """List form of iter_evidence() for callers that need random access or multiple passes."""
+    return list(iter_evidence(evidence_path))
+
+
+@dataclass(frozen=True)
+class _DocContext:
+    """Per-run settings shared by every _events_for_doc call (picklable for worker processes)."""
+    project_tokens: Tuple[str, ...]
+    city: Optional[str]
+    rera_pat: Optional[re.Pattern]
+    min_confidence: float
+    max_events_per_doc: int
+    strong_required: bool
+
+
+def _events_for_doc(e: Any, ctx: _DocContext) -> List[TimelineEvent]:
+    """Raw events for one evidence doc (no cross-doc state, so safe to run in a worker)."""
+    if not isinstance(e, dict):
+        return []
+    if (e.get("textChars") or 0) <= 0:
+        return []
+
+    text_path = str(e.get("textPath") or "")
+    project_tokens, city, rera_pat = ctx.project_tokens, ctx.city, ctx.rera_pat
+
+    # Doc-level gate. It only looks at the first _DOC_GATE_CHARS of text, so read just that
+    # much first; off-project docs never get loaded in full.
+    if (project_tokens or rera_pat):
+        if not _is_doc_relevant(
+            text=load_text_head(text_path, _DOC_GATE_CHARS),
+            snippet=str(e.get("snippet") or ""),
+            url=str(e.get("finalUrl") or e.get("url") or ""),
+            project_tokens=project_tokens,
+            city=city,
+            rera_pat=rera_pat,
+        ):
+            return []
+
+    text = load_text(text_path)
+    # Normalize once per doc; reused for the keyword prescreen and date scanning.
+    norm_text = " ".join(text.split())
+    if not norm_text:
+        return []
+
+    # Cheap prescreen: without a strong keyword anywhere in the doc, no snippet can
+    # reach min_confidence, so skip date scanning (and dateparser) entirely.
+    if ctx.strong_required:
+        norm_lower = norm_text.lower()
+        if not any(k in norm_lower for k in _STRONG_KWS):
+            return []
+
+    found = _find_events_in_text(norm_text)
+
+    # Lazy partial sort in (-confidence, date, position) order: heapify is O(n) and we only pop
+    # as many candidates as the gates below consume before max_events_per_doc is reached.
+    heap = [(-conf, iso, i) for i, (iso, _, conf, _) in enumerate(found) if conf >= ctx.min_confidence]
+    heapq.heapify(heap)
+
+    kept: List[Tuple[str, str, float, List[str]]] = []
+    while heap:
+        iso, snippet, conf, tags = found[heapq.heappop(heap)[2]]
+
+        # Event-level gate (critical for multi-case PDFs)
+        if (project_tokens or rera_pat):
+            if not _is_event_relevant(snippet=snippet, project_tokens=project_tokens, city=city, rera_pat=rera_pat):
+                continue
+
+        # No "snippet in norm_text" re-check: snippets are sliced straight out of norm_text.
+        kept.append((iso, snippet, conf, tags))
+        if len(kept) >= ctx.max_events_per_doc:
+            break
+
+    return [
+        TimelineEvent(
+            date=iso,
+            claim=_claim_from_snippet(snippet),
+            confidence=conf,
+            tags=tags,
+            evidence=EvidenceRef(
+                doc_id=str(e.get("id") or ""),
+                url=str(e.get("url") or ""),
+                final_url=str(e.get("finalUrl") or e.get("url") or ""),
+                domain=str(e.get("domain") or ""),
+                snippet=snippet,
+                text_path=str(e.get("textPath") or ""),
+            ),
+        )
+        for iso, snippet, conf, tags in kept
+    ]
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """None -> $STALLED_NEWS_WORKERS (unset/invalid -> 1); any value <= 0 -> one per CPU."""
+    if workers is None:
+        raw = (os.getenv("STALLED_NEWS_WORKERS") or "").strip()
+        try:
+            workers = int(raw) if raw else 1
+        except ValueError:
+            workers = 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
 def extract_events_from_evidence(
     evidence_path: Path,
     *,
@@ -439,6 +672,7 @@ def extract_events_from_evidence(
     project_name: Optional[str] = None,
     city: Optional[str] = None,
     rera_id: Optional[str] = None,
+    workers: Optional[int] = None,
 ) -> Tuple[List[TimelineEvent], List[TimelineEvent]]:
     """Extract dated, snippet-backed events.
 
@@ -449,101 +683,69 @@ def extract_events_from_evidence(
     This prevents:
     - random nic.in pages (whitelist too broad) from polluting timelines
     - HRERA/cause-list PDFs containing multiple projects from leaking other projects' events
+
+    workers > 1 spreads per-doc extraction over a process pool (output is identical);
+    None reads STALLED_NEWS_WORKERS (default 1); 0 or less (either way) = one per CPU.
     """
 
-    ev = load_evidence(evidence_path)
+    # Parse evidence.json once; hints and docs both read from it.
+    data = load_json(evidence_path)
 
     # Best-effort hints
-    pj_name, pj_city, pj_rera = _load_project_hints(evidence_path)
+    pj_name, pj_city, pj_rera = _load_project_hints(evidence_path, data)
     project_name = project_name or pj_name
     city = city or pj_city
     rera_id = rera_id or pj_rera
 
     if not rera_id:
-        rera_id = _infer_rera_from_docs(ev)
+        # Inference only looks at the first 40 docs; reuse the parsed data instead of re-reading.
+        rera_id = _infer_rera_from_docs(list(islice(iter_evidence(evidence_path, data), 40)))
+
+    # Docs are consumed lazily, one dict at a time.
+    ev: Iterable[Dict[str, Any]] = iter_evidence(evidence_path, data)
 
     project_tokens = _tokenize_project(project_name)
     rera_pat = _rera_pattern(rera_id)
 
-    raw: List[TimelineEvent] = []
-
-    for e in ev:
-        if not isinstance(e, dict):
-            continue
-        if (e.get("textChars") or 0) <= 0:
-            continue
-
-        text = load_text(str(e.get("textPath") or ""))
-        if not text.strip():
-            continue
-
-        # Doc-level gate
-        if (project_tokens or rera_pat):
-            if not _is_doc_relevant(
-                text=text,
-                snippet=str(e.get("snippet") or ""),
-                url=str(e.get("finalUrl") or e.get("url") or ""),
-                project_tokens=project_tokens,
-                city=city,
-                rera_pat=rera_pat,
-            ):
-                continue
-
-        found = _find_events_in_text(text)
-        found = sorted(found, key=lambda x: (-x[2], x[0]))
-
-        kept: List[Tuple[str, str, float, List[str]]] = []
-        for iso, snippet, conf, tags in found:
-            if conf < min_confidence:
-                continue
-
-            # Event-level gate (critical for multi-case PDFs)
-            if (project_tokens or rera_pat):
-                if not _is_event_relevant(snippet=snippet, project_tokens=project_tokens, city=city, rera_pat=rera_pat):
-                    continue
-
-            # Validate snippet exists in normalized text
-            if snippet not in " ".join(text.split()):
-                continue
-
-            kept.append((iso, snippet, conf, tags))
-            if len(kept) >= max_events_per_doc:
-                break
+    ctx = _DocContext(
+        project_tokens=project_tokens,
+        city=city,
+        rera_pat=rera_pat,
+        min_confidence=min_confidence,
+        max_events_per_doc=max_events_per_doc,
+        strong_required=min_confidence > _WEAK_CONF_CEILING,
+    )
 
-        for iso, snippet, conf, tags in kept:
-            raw.append(
-                TimelineEvent(
-                    date=iso,
-                    claim=_claim_from_snippet(snippet),
-                    confidence=conf,
-                    tags=tags,
-                    evidence=EvidenceRef(
-                        doc_id=str(e.get("id") or ""),
-                        url=str(e.get("url") or ""),
-                        final_url=str(e.get("finalUrl") or e.get("url") or ""),
-                        domain=str(e.get("domain") or ""),
-                        snippet=snippet,
-                        text_path=str(e.get("textPath") or ""),
-                    ),
-                )
-            )
-
-    # Dedupe: (date + normalized claim prefix)
-    seen = set()
-    deduped: List[TimelineEvent] = []
-    for item in sorted(raw, key=lambda x: (x.date, -x.confidence)):
-        core = _normalize(item.claim)[:160]
-        key = (item.date, core)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(item)
+    workers = _resolve_workers(workers)
 
-    deduped = sorted(deduped, key=lambda x: (x.date, -x.confidence))
+    raw: List[TimelineEvent] = []
+    if workers > 1:
+        # Docs are independent and CPU-bound (regex + dateparser); map() keeps input order.
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for events in ex.map(partial(_events_for_doc, ctx=ctx), ev, chunksize=4):
+                raw.extend(events)
+    else:
+        for e in ev:
+            raw.extend(_events_for_doc(e, ctx))
+
+    # Dedupe: (date + normalized claim prefix) -> highest confidence (earliest on ties),
+    # in one pass over raw; only the survivors get sorted.
+    best: Dict[Tuple[str, str], Tuple[int, TimelineEvent]] = {}
+    for idx, item in enumerate(raw):
+        key = _dedupe_key(item)
+        cur = best.get(key)
+        if cur is None or item.confidence > cur[1].confidence:
+            best[key] = (idx, item)
+    survivors = sorted(best.values(), key=lambda x: (x[1].date, -x[1].confidence, x[0]))
+    deduped = [item for _, item in survivors]
     return raw, deduped
 
 
 def store_timeline(events: List[TimelineEvent], out_path: Path) -> None:
+    out_path.write_bytes(_timeline_json(events))
+
+
+def _timeline_json(events: List[TimelineEvent]) -> bytes:
     payload = []
     for e in events:
         payload.append(
@@ -562,7 +764,7 @@ def store_timeline(events: List[TimelineEvent], out_path: Path) -> None:
                 },
             }
         )
-    out_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return dumps_pretty(payload) + b"\n"
 
 
 def store_events(evidence_path, raw, deduped):
@@ -586,7 +788,9 @@ def store_events(evidence_path, raw, deduped):
     timeline_path = run_dir / "timeline.json"
 
     store_timeline(raw, raw_path)
-    store_timeline(deduped, dedup_path)
-    store_timeline(deduped, timeline_path)
+    # events_deduped.json and timeline.json are the same document: serialize once.
+    deduped_json = _timeline_json(deduped)
+    dedup_path.write_bytes(deduped_json)
+    timeline_path.write_bytes(deduped_json)
 
     return str(raw_path), str(dedup_path), str(timeline_path)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import json
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from .fetcher import fetch_url, stable_id_for_url
+import httpx
+
+from .fetcher import fetch_url, make_client, stable_id_for_url
+from .jsonio import dumps_pretty, load_json
 from .models import EvidenceDoc, ProjectInput, SerpFetchMeta, SerpResult, SerpRun
 from .extractors import extract_text_from_html, extract_text_from_pdf_bytes
 
@@ -33,8 +38,7 @@ def load_serp_run(path: Path) -> SerpRun:
     2) wide SERP list JSON: [ {link,title,snippet,domain,source_query,...}, ... ]
     3) wide SERP wrapper object (if any): {whitelisted:[...]} or {results:[...]}
     """
-    raw = path.read_text(encoding="utf-8", errors="ignore")
-    data = json.loads(raw)
+    data = load_json(path)
 
     # Case 1: canonical object
     if isinstance(data, dict) and "results" in data and "project" in data:
@@ -85,23 +89,87 @@ def load_serp_run(path: Path) -> SerpRun:
     )
 
 
+# sources/ and texts/ are created once per run in fetch_and_extract_from_serp, so the
+# per-doc writers skip the mkdir (a stat + mkdir syscall pair per file).
 def _write_bytes(path: Path, b: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
     path.write_bytes(b)
 
 
 def _write_text(path: Path, s: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(s, encoding="utf-8", errors="ignore")
 
 
-def fetch_and_extract_from_serp(serp_results_path: Path) -> Dict[str, Any]:
+def _call(pool: Optional[Executor], fn: Any, *args: Any, **kwargs: Any) -> Any:
+    if pool is None:
+        return fn(*args, **kwargs)
+    return pool.submit(fn, *args, **kwargs).result()
+
+
+def _fetch_doc(
+    r: SerpResult,
+    url: str,
+    doc_id: str,
+    client: httpx.Client,
+    sources_dir: Path,
+    texts_dir: Path,
+    extract_pool: Optional[Executor] = None,
+) -> Optional[EvidenceDoc]:
+    """Fetch + extract one URL; None on any failure (fetch, extraction or write).
+
+    With `extract_pool`, the CPU-bound HTML/PDF parsing runs in that (process) pool and this
+    thread just waits on it, so parsing doesn't hold the GIL against other fetches.
+    """
+    resp = fetch_url(url, client=client)
+    if resp is None:
+        return None
+
+    final_url = str(resp.url)
+    ctype = (resp.headers.get("content-type") or "").lower().split(";")[0].strip()
+
+    snippet = r.snippet or ""
+
+    try:
+        if "pdf" in ctype or final_url.lower().endswith(".pdf"):
+            raw_path = sources_dir / f"{doc_id}.pdf"
+            _write_bytes(raw_path, resp.content)
+            extracted = _call(extract_pool, extract_text_from_pdf_bytes, url, resp.content, snippet=snippet, final_url=final_url)
+        else:
+            raw_path = sources_dir / f"{doc_id}.html"
+            html = resp.text
+            _write_text(raw_path, html)
+            extracted = _call(extract_pool, extract_text_from_html, url, html, snippet=snippet, final_url=final_url)
+
+        text_path = texts_dir / f"{doc_id}.txt"
+        _write_text(text_path, extracted.text or "")
+
+        return EvidenceDoc(
+            doc_id=doc_id,
+            url=url,
+            final_url=final_url,
+            domain=extracted.domain or (r.domain or ""),
+            snippet=snippet,
+            text_path=str(text_path),
+        )
+    except Exception:
+        return None
+
+
+def fetch_and_extract_from_serp(
+    serp_results_path: Path,
+    *,
+    concurrency: int = 8,
+    extract_workers: int = 1,
+) -> Dict[str, Any]:
     """
     Fetch + extract every URL in serp_results into:
       - sources/<doc_id>.(html|pdf)
       - texts/<doc_id>.txt
     Writes evidence.json in the same run dir.
     Never crashes the pipeline on timeouts; counts failures and continues.
+
+    Up to `concurrency` URLs are in flight at once (threads sharing one pooled client);
+    docs keep SERP order in evidence.json. extract_workers > 1 moves HTML/PDF parsing to a
+    process pool of that size (output is identical).
     """
     serp_run = load_serp_run(serp_results_path)
 
@@ -111,13 +179,9 @@ def fetch_and_extract_from_serp(serp_results_path: Path) -> Dict[str, Any]:
     sources_dir.mkdir(parents=True, exist_ok=True)
     texts_dir.mkdir(parents=True, exist_ok=True)
 
-    docs: List[EvidenceDoc] = []
+    # Dedupe up front (cheap, order-preserving); only the network/extraction work is concurrent.
+    jobs: List[Tuple[SerpResult, str, str]] = []
     seen: set[str] = set()
-
-    successes = 0
-    failures = 0
-    total = 0
-
     for r in serp_run.results:
         url = (r.link or "").strip()
         if not url:
@@ -127,46 +191,33 @@ def fetch_and_extract_from_serp(serp_results_path: Path) -> Dict[str, Any]:
         if doc_id in seen:
             continue
         seen.add(doc_id)
-        total += 1
+        jobs.append((r, url, doc_id))
 
-        resp = fetch_url(url)
-        if resp is None:
-            failures += 1
-            continue
-
-        final_url = str(resp.url)
-        ctype = (resp.headers.get("content-type") or "").lower().split(";")[0].strip()
-
-        snippet = r.snippet or ""
-
-        try:
-            if "pdf" in ctype or final_url.lower().endswith(".pdf"):
-                raw_path = sources_dir / f"{doc_id}.pdf"
-                _write_bytes(raw_path, resp.content)
-                extracted = extract_text_from_pdf_bytes(url, resp.content, snippet=snippet, final_url=final_url)
-            else:
-                raw_path = sources_dir / f"{doc_id}.html"
-                html = resp.text
-                _write_text(raw_path, html)
-                extracted = extract_text_from_html(url, html, snippet=snippet, final_url=final_url)
-
-            text_path = texts_dir / f"{doc_id}.txt"
-            _write_text(text_path, extracted.text or "")
-
-            docs.append(
-                EvidenceDoc(
-                    doc_id=doc_id,
-                    url=url,
-                    final_url=final_url,
-                    domain=extracted.domain or (r.domain or ""),
-                    snippet=snippet,
-                    text_path=str(text_path),
+    docs: List[EvidenceDoc] = []
+    if jobs:
+        n = max(1, min(concurrency, len(jobs)))
+        with ExitStack() as stack:
+            client = stack.enter_context(make_client(max_connections=n))
+            extract_pool = None
+            if extract_workers > 1:
+                # Workers start lazily from inside fetch threads; forking a multi-threaded
+                # process can deadlock on locks held mid-request, so spawn them instead.
+                extract_pool = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=extract_workers, mp_context=multiprocessing.get_context("spawn"))
                 )
-            )
-            successes += 1
-        except Exception:
-            failures += 1
-            continue
+            ex = stack.enter_context(ThreadPoolExecutor(max_workers=n))
+            futures = [
+                ex.submit(_fetch_doc, r, url, doc_id, client, sources_dir, texts_dir, extract_pool)
+                for r, url, doc_id in jobs
+            ]
+            for fut in futures:
+                doc = fut.result()
+                if doc is not None:
+                    docs.append(doc)
+
+    total = len(jobs)
+    successes = len(docs)
+    failures = total - successes
 
     evidence = {
         "project": serp_run.project.model_dump(),
@@ -177,6 +228,6 @@ def fetch_and_extract_from_serp(serp_results_path: Path) -> Dict[str, Any]:
     }
 
     out_path = run_dir / "evidence.json"
-    out_path.write_text(json.dumps(evidence, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    out_path.write_bytes(dumps_pretty(evidence) + b"\n")
 
     return {"evidence_path": str(out_path), "counts": evidence["counts"]}
@@ -41,21 +41,43 @@ def stable_id_for_url(url: str) -> str:
     return hashlib.sha256(norm.encode("utf-8", errors="ignore")).hexdigest()[:16]
 
 
+_TIMEOUT = httpx.Timeout(connect=10.0, read=20.0, write=10.0, pool=10.0)
+
+
+def make_client(max_connections: int = 20) -> httpx.Client:
+    """
+    One client per fetch run: keeps connections alive across URLs on the same host.
+    httpx.Client is thread-safe, so concurrent fetches can share it.
+    """
+    return httpx.Client(
+        headers=DEFAULT_HEADERS,
+        timeout=_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
-def _fetch_once(url: str) -> httpx.Response:
-    timeout = httpx.Timeout(connect=10.0, read=20.0, write=10.0, pool=10.0)
-    with httpx.Client(headers=DEFAULT_HEADERS, timeout=timeout, follow_redirects=True) as client:
-        r = client.get(url)
-        r.raise_for_status()
-        return r
+def _fetch_once(url: str, client: Optional[httpx.Client] = None) -> httpx.Response:
+    if client is None:
+        with make_client() as own:
+            return _get(own, url)
+    return _get(client, url)
+
+
+def _get(client: httpx.Client, url: str) -> httpx.Response:
+    r = client.get(url)
+    r.raise_for_status()
+    return r
 
 
-def fetch_url(url: str) -> Optional[httpx.Response]:
+def fetch_url(url: str, client: Optional[httpx.Client] = None) -> Optional[httpx.Response]:
     """
     Fetch a URL with retry. Returns None on final failure.
+    Pass a shared `client` (see make_client) to reuse connections across calls.
     IMPORTANT: Do NOT raise RetryError up the stack (keeps pipeline running).
     """
     try:
-        return _fetch_once(url)
+        return _fetch_once(url, client)
     except Exception:
         return None
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson  # optional: C parser/serializer, several times faster than stdlib json
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def load_json(path: Path) -> Any:
+    """
+    Parse a JSON file straight from bytes (no intermediate str decode).
+    Uses orjson when installed, stdlib json otherwise.
+    """
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes with 2-space indent (same layout as
+    json.dumps(indent=2, ensure_ascii=False)), ready for Path.write_bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -5,7 +5,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 import json
 import os
+import re
 
+from .jsonio import dumps_pretty
 from .models import ProjectInput
 from .openai_client import openai_chat_json
 from .whitelist import host_from_url
@@ -16,13 +18,12 @@ def _load_json(path: Path) -> Any:
 
 
 def _safe_read_text_chars(p: Optional[str]) -> int:
+    # Size via stat() (bytes, == chars for ASCII text) instead of reading and decoding the
+    # whole file; only used to rank a domain's docs by size and as a rough length hint.
     try:
         if not p:
             return 0
-        fp = Path(p)
-        if not fp.exists():
-            return 0
-        return len(fp.read_text(encoding="utf-8", errors="replace"))
+        return Path(p).stat().st_size
     except Exception:
         return 0
 
@@ -278,6 +279,9 @@ def _domain_diversity_pack(evidence: List[Dict[str, Any]], events: List[Dict[str
 
 
 
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _filter_evidence_for_project(
     evidence: List[Dict[str, Any]],
     events: List[Dict[str, Any]],
@@ -308,7 +312,7 @@ def _filter_evidence_for_project(
     city = (project.city or "").lower()
     rera = (project.rera_id or "").lower().replace("/", "")
 
-    toks = [t for t in re.split(r"[^a-z0-9]+", proj) if len(t) >= 3]
+    toks = [t for t in _TOKEN_SPLIT_RE.split(proj) if len(t) >= 3]
 
     def looks_relevant(e: Dict[str, Any]) -> bool:
         blob = " ".join(
@@ -469,8 +473,8 @@ def build_news_with_openai(
     out_raw_json = run_dir / "news_llm_raw.json"
     out_html = run_dir / "news.html"
 
-    out_news_json.write_text(json.dumps(news, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-    out_inputs_json.write_text(json.dumps(user_obj, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    out_news_json.write_bytes(dumps_pretty(news) + b"\n")
+    out_inputs_json.write_bytes(dumps_pretty(user_obj) + b"\n")
     out_raw_json.write_text(json.dumps({"ok": True}, indent=2) + "\n", encoding="utf-8")
 
     # HTML render (no backlinks)
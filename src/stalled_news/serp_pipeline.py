@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 from .config import repo_root, load_yaml
+from .jsonio import dumps_pretty
 from .models import ProjectInput, SerpFetchMeta, SerpResult, SerpRun
 from .query_pack import build_query_pack
 from .serpapi_client import fetch_serp_response
@@ -165,17 +166,8 @@ def store_serp_run_with_debug(run: SerpRun, all_debug: List[Dict[str, Any]], dom
     out_path = target_dir / "serp_results.json"
     out_path.write_text(run.model_dump_json(indent=2), encoding="utf-8")
 
-    (target_dir / "serp_results_all.json").write_text(
-        __import__("json").dumps(all_debug, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-    (target_dir / "serp_domains_summary.json").write_text(
-        __import__("json").dumps(domain_counts, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-    (target_dir / "serp_raw_debug.json").write_text(
-        __import__("json").dumps(raw_debug, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    (target_dir / "serp_results_all.json").write_bytes(dumps_pretty(all_debug))
+    (target_dir / "serp_domains_summary.json").write_bytes(dumps_pretty(domain_counts))
+    (target_dir / "serp_raw_debug.json").write_bytes(dumps_pretty(raw_debug))
 
     return out_path
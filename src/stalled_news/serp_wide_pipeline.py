@@ -68,13 +68,7 @@ def build_wide_queries(project: ProjectInput) -> List[str]:
         q.append(f"site:{d} \"{pn}\" \"{city}\"")
 
     # De-dupe preserving order
-    seen = set()
-    out = []
-    for x in q:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    return list(dict.fromkeys(q))
 
 
 def run_serp_wide(
@@ -86,6 +80,7 @@ def run_serp_wide(
     policy: str = "allow",
 ) -> WideSerpRun:
     queries = build_wide_queries(project)
+    wl_policy = load_whitelist_policy()  # built once for the whole sweep
 
     all_results: List[Dict[str, Any]] = []
     whitelisted: List[Dict[str, Any]] = []
@@ -115,7 +110,7 @@ def run_serp_wide(
             }
             all_results.append(item)
 
-            if is_url_allowed(url, load_whitelist_policy()):
+            if is_url_allowed(url, wl_policy):
                 whitelisted.append(item)
 
     return WideSerpRun(queries=queries, all_results=all_results, whitelisted=whitelisted, domain_counts=domain_counts)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from typing import Iterable, Optional, Set, List
 from urllib.parse import urlparse
@@ -9,6 +10,9 @@ def _norm_domain(d: str) -> str:
     return (d or "").strip().lower().rstrip(".")
 
 
+_PLAIN_NETLOC_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://([^/?#@\[\]%\s\x00-\x1f\x7f]*)(?=[/?#]|\Z)")
+
+
 def host_from_url(url: str) -> str:
     """
     Robust host extraction (no scheme -> still try).
@@ -19,6 +23,11 @@ def host_from_url(url: str) -> str:
         return ""
     if "://" not in u:
         u = "https://" + u
+    # Fast path for plain scheme://host[:port] URLs (nearly every SERP link). Anything with
+    # userinfo, brackets, zone ids, controls or non-ASCII goes through urlparse as before.
+    m = _PLAIN_NETLOC_RE.match(u)
+    if m and m.group(1).isascii():
+        return _norm_domain(m.group(1).partition(":")[0])
     try:
         host = urlparse(u).hostname or ""
     except Exception:
@@ -40,6 +49,23 @@ class WhitelistPolicy:
     allowed_domains: Set[str] = field(default_factory=set)
     allow_subdomains_for: List[str] = field(default_factory=list)
 
+    @classmethod
+    def from_config(
+        cls,
+        allowed_domains: Iterable[str],
+        subdomain_allowed: Optional[Iterable[str]] = None,
+    ) -> "WhitelistPolicy":
+        """
+        Build a policy from the raw `domains` / `subdomain_allowed` lists in whitelist.yaml.
+        Entries are normalized (lowercase, no trailing dot) and blanks dropped.
+        """
+        domains = {_norm_domain(str(d)) for d in (allowed_domains or [])}
+        sub_ok = [_norm_domain(str(d)) for d in (subdomain_allowed or [])]
+        return cls(
+            allowed_domains={d for d in domains if d},
+            allow_subdomains_for=[d for d in sub_ok if d],
+        )
+
 
 def is_url_allowed(url: str, policy: WhitelistPolicy) -> bool:
     """
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import yaml
-
+from .config import load_yaml
 from .whitelist import WhitelistPolicy
 
 
@@ -23,7 +23,7 @@ def load_whitelist_domains(path: Optional[str] = None) -> List[str]:
       - legacy list YAML: [ "a.com", "b.com", ... ]
     """
     p = Path(path) if path else _default_whitelist_path()
-    data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    data = load_yaml(p)
 
     # legacy: YAML is a list
     if isinstance(data, list):
@@ -36,22 +36,25 @@ def load_whitelist_domains(path: Optional[str] = None) -> List[str]:
     raw = data.get("domains") or []
     domains = [str(x).strip().lower().rstrip(".") for x in raw if str(x).strip()]
     # de-dupe preserve order
-    seen = set()
-    out: List[str] = []
-    for d in domains:
-        if d not in seen:
-            seen.add(d)
-            out.append(d)
-    return out
+    return list(dict.fromkeys(domains))
 
 
 def load_whitelist_policy(path: Optional[str] = None) -> WhitelistPolicy:
     """
     Builds WhitelistPolicy from YAML.
     If subdomain_allowed is missing, defaults to [].
+
+    Memoized on (path, mtime): repeated calls return the same policy object until
+    the file changes, so callers must treat it as read-only.
     """
     p = Path(path) if path else _default_whitelist_path()
-    data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    return _whitelist_policy(str(p), p.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _whitelist_policy(path_str: str, mtime_ns: int) -> WhitelistPolicy:
+    p = Path(path_str)
+    data = load_yaml(p)
 
     # legacy: YAML is a list => treat as domains only
     if isinstance(data, list):
@@ -0,0 +1,30 @@
+from stalled_news import config
+from stalled_news.config import load_config
+
+
+def _write_configs(tmp_path):
+    settings = tmp_path / "settings.yaml"
+    whitelist = tmp_path / "whitelist.yaml"
+    settings.write_text("app:\n  env: local\n", encoding="utf-8")
+    whitelist.write_text("domains:\n  - thehindu.com\n", encoding="utf-8")
+    return settings, whitelist
+
+
+def test_load_config_rereads_env_between_calls(tmp_path, monkeypatch):
+    settings, whitelist = _write_configs(tmp_path)
+    # Skip the repo .env so only the process environment is exercised.
+    monkeypatch.setattr(config, "_DOTENV_LOADED", True)
+    monkeypatch.delenv("APP_ENV", raising=False)
+    monkeypatch.delenv("SERPAPI_API_KEY", raising=False)
+
+    first = load_config(settings, whitelist)
+    assert first.env == "local"
+    assert first.serpapi_api_key_present is False
+
+    monkeypatch.setenv("APP_ENV", "prod")
+    monkeypatch.setenv("SERPAPI_API_KEY", "k")
+
+    second = load_config(settings, whitelist)
+    assert second.env == "prod"
+    assert second.serpapi_api_key_present is True
+    assert second.whitelist_domains == ("thehindu.com",)
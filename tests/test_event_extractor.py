@@ -0,0 +1,43 @@
+import os
+
+from stalled_news.event_extractor import DATE_RE, _find_events_in_text, _resolve_workers
+
+
+def test_date_re_matches_each_shape_once():
+    text = "Heard on 27.06.2022, listed 2022-07-15, order dated June 5th, 2021 and 3 Aug 2019."
+    shapes = [(m.lastgroup, m.group(0)) for m in DATE_RE.finditer(text)]
+    assert shapes == [
+        ("dmy", "27.06.2022"),
+        ("ymd", "2022-07-15"),
+        ("mdy", "June 5th, 2021"),
+        ("dmony", "3 Aug 2019"),
+    ]
+
+
+def test_find_events_in_text_returns_iso_dates():
+    text = (
+        "The Authority heard the complaint against the promoter on 27.06.2022 and directed "
+        "the promoter to file a reply. The matter will come up again on 15 July 2022."
+    )
+    isos = [iso for iso, _, _, _ in _find_events_in_text(text)]
+    assert isos == ["2022-06-27", "2022-07-15"]
+
+
+def test_iso_dates_keep_year_month_day_order():
+    text = (
+        "The Authority order uploaded on 2023-07-22 records that the hearing held on "
+        "2023-08-03 was adjourned by the promoter."
+    )
+    isos = [iso for iso, _, _, _ in _find_events_in_text(text)]
+    assert isos == ["2023-07-22", "2023-08-03"]
+
+
+def test_explicit_and_env_workers_share_the_cpu_count_rule(monkeypatch):
+    cpus = os.cpu_count() or 1
+    monkeypatch.delenv("STALLED_NEWS_WORKERS", raising=False)
+    assert _resolve_workers(None) == 1
+    assert _resolve_workers(0) == cpus
+    assert _resolve_workers(3) == 3
+
+    monkeypatch.setenv("STALLED_NEWS_WORKERS", "0")
+    assert _resolve_workers(None) == cpus
@@ -0,0 +1,62 @@
+import json
+import threading
+import time
+
+import httpx
+
+from stalled_news import evidence_pipeline
+
+
+def test_fetch_keeps_serp_order_dedupes_and_counts(tmp_path, monkeypatch):
+    links = [
+        "https://a.example/1",
+        "https://b.example/2",
+        "https://a.example/1",  # duplicate of the first link
+        "https://c.example/missing",
+        "",
+        "https://d.example/4",
+    ]
+    run_dir = tmp_path / "slug" / "20250101T000000Z"
+    run_dir.mkdir(parents=True)
+    serp_path = run_dir / "serp_results.json"
+    serp_path.write_text(
+        json.dumps([{"link": u, "title": "t", "snippet": f"s{i}"} for i, u in enumerate(links)]),
+        encoding="utf-8",
+    )
+
+    calls = []
+    lock = threading.Lock()
+    delays = {"https://a.example/1": 0.15, "https://b.example/2": 0.05, "https://d.example/4": 0.0}
+
+    def fake_fetch_url(url, client=None):
+        with lock:
+            calls.append(url)
+        if url not in delays:
+            return None
+        # Earlier SERP entries finish last, so completion order differs from SERP order.
+        time.sleep(delays[url])
+        return httpx.Response(
+            200,
+            text=f"<html><body><p>page {url}</p></body></html>",
+            headers={"content-type": "text/html; charset=utf-8"},
+            request=httpx.Request("GET", url),
+        )
+
+    monkeypatch.setattr(evidence_pipeline, "fetch_url", fake_fetch_url)
+
+    out = evidence_pipeline.fetch_and_extract_from_serp(serp_path, concurrency=4)
+
+    # Each unique non-empty link is fetched exactly once.
+    assert sorted(calls) == [
+        "https://a.example/1",
+        "https://b.example/2",
+        "https://c.example/missing",
+        "https://d.example/4",
+    ]
+    assert out["counts"] == {"total": 4, "successes": 3, "failures": 1}
+
+    evidence = json.loads((run_dir / "evidence.json").read_text(encoding="utf-8"))
+    assert [d["url"] for d in evidence["docs"]] == ["https://a.example/1", "https://b.example/2", "https://d.example/4"]
+    assert [d["snippet"] for d in evidence["docs"]] == ["s0", "s1", "s5"]
+    for d in evidence["docs"]:
+        assert "page " + d["url"] in open(d["text_path"], encoding="utf-8").read()
@@ -0,0 +1,16 @@
+from stalled_news.models import ProjectInput
+from stalled_news.news_generator import _filter_evidence_for_project
+
+
+def test_filter_evidence_keeps_event_refs_and_relevant_docs():
+    project = ProjectInput(project_name="ATS Grandstand", city="Gurgaon", rera_id=None)
+    evidence = [
+        {"id": "d1", "title": "ATS Grandstand possession delayed", "url": "https://example.com/a"},
+        {"id": "d2", "title": "Unrelated market report", "url": "https://example.com/b"},
+        {"id": "d3", "title": "Order on complaint", "url": "https://example.com/c"},
+    ]
+    events = [{"source": {"doc_id": "d3"}}]
+
+    kept = _filter_evidence_for_project(evidence, events, project)
+
+    assert [e["id"] for e in kept] == ["d3", "d1"]